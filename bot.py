@@ -4,6 +4,14 @@ from eth_account.messages import encode_defunct
 import json
 import time
 import os
+import stat
+import sys
+import socket
+import socketserver
+import threading
+import argparse
+import getpass
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 from datetime import datetime, timedelta
 from colorama import Fore, Back, Style, init
@@ -115,7 +123,7 @@ class HumanoidAuthBot:
             print(f"{Colors.ERROR}│  └─ ✗ Training error: {str(e)[:100]}{Colors.RESET}")
             return None
     
-    def get_training_models(self) -> list:
+    def get_training_models(self, use_defaults: bool = True) -> list:
         try:
             with open('models.txt', 'r') as f:
                 models = []
@@ -133,9 +141,12 @@ class HumanoidAuthBot:
                 if models:
                     return models
         except FileNotFoundError:
-            print(f"{Colors.WARNING}├─ models.txt not found, using default models{Colors.RESET}")
+            if use_defaults:
+                print(f"{Colors.WARNING}├─ models.txt not found, using default models{Colors.RESET}")
         except Exception as e:
             print(f"{Colors.WARNING}├─ Error reading models.txt: {str(e)[:50]}{Colors.RESET}")
+        if not use_defaults:
+            return []
         return [
             {
                 "fileName": "microsoft/VibeVoice-Realtime-0.5B",
@@ -154,7 +165,7 @@ class HumanoidAuthBot:
             }
         ]
     
-    def get_training_datasets(self) -> list:
+    def get_training_datasets(self, use_defaults: bool = True) -> list:
         try:
             with open('datasets.txt', 'r') as f:
                 datasets = []
@@ -172,9 +183,12 @@ class HumanoidAuthBot:
                 if datasets:
                     return datasets
         except FileNotFoundError:
-            print(f"{Colors.WARNING}├─ datasets.txt not found, using default datasets{Colors.RESET}")
+            if use_defaults:
+                print(f"{Colors.WARNING}├─ datasets.txt not found, using default datasets{Colors.RESET}")
         except Exception as e:
             print(f"{Colors.WARNING}├─ Error reading datasets.txt: {str(e)[:50]}{Colors.RESET}")
+        if not use_defaults:
+            return []
         return [
             {
                 "fileName": "nvidia/PhysicalAI-Autonomous-Vehicles",
@@ -217,7 +231,7 @@ class HumanoidAuthBot:
             print(f"{Colors.ERROR}[!] Error managing progress: {e}{Colors.RESET}")
             return all_items[:items_per_cycle]
     
-    def get_user_info(self, token: str) -> Optional[dict]:
+    def get_user_info(self, token: str, quiet: bool = False) -> Optional[dict]:
         try:
             url = f"{self.base_url}/user"
             headers = self.headers.copy()
@@ -226,7 +240,8 @@ class HumanoidAuthBot:
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            print(f"{Colors.ERROR}├─ ✗ User info error: {str(e)[:50]}{Colors.RESET}")
+            if not quiet:
+                print(f"{Colors.ERROR}├─ ✗ User info error: {str(e)[:50]}{Colors.RESET}")
             return None
     
     def login(self, private_key: str) -> Optional[str]:
@@ -259,7 +274,7 @@ class HumanoidAuthBot:
             print(f"{Colors.ERROR}├─ ✗ Login failed: {str(e)[:50]}{Colors.RESET}")
             return None
     
-    def process_account(self, private_key: str, index: int, total: int, models: list, datasets: list) -> bool:
+    def process_account(self, private_key: str, index: int, total: int, models: list, datasets: list, tokens: Optional[dict] = None) -> bool:
         try:
             if not private_key.startswith('0x'):
                 private_key = '0x' + private_key
@@ -270,14 +285,25 @@ class HumanoidAuthBot:
             print(f"{Colors.WALLET}Wallet: {wallet_address}{Colors.RESET}")
             print(f"{Colors.HEADER}{'─' * 60}{Colors.RESET}")
             
-            # Login and get initial user info
-            token = self.login(private_key)
+            # Reuse the cached session token if given one, fall back to a fresh login
+            token = tokens.get(wallet_address) if tokens is not None else None
+            initial_user_info = None
+            if token:
+                print(f"{Colors.INFO}├─ Reusing session, getting initial user info...{Colors.RESET}")
+                initial_user_info = self.get_user_info(token, quiet=True)
+                if not initial_user_info:
+                    print(f"{Colors.INFO}├─ Session expired, logging in again...{Colors.RESET}")
+                    tokens.pop(wallet_address, None)
+                    token = None
             if not token:
-                print(f"{Colors.ERROR}└─ ✗ Process failed at login{Colors.RESET}")
-                return False
-            
-            print(f"{Colors.INFO}├─ Getting initial user info...{Colors.RESET}")
-            initial_user_info = self.get_user_info(token)
+                token = self.login(private_key)
+                if not token:
+                    print(f"{Colors.ERROR}└─ ✗ Process failed at login{Colors.RESET}")
+                    return False
+                if tokens is not None:
+                    tokens[wallet_address] = token
+                print(f"{Colors.INFO}├─ Getting initial user info...{Colors.RESET}")
+                initial_user_info = self.get_user_info(token)
             initial_points = 0
             if initial_user_info:
                 initial_points = initial_user_info.get('totalPoints', 0)
@@ -356,6 +382,70 @@ def read_accounts(filename: str = "accounts.txt") -> list:
         print(f"{Colors.ERROR}[!] Error reading file: {e}{Colors.RESET}")
         return []
 
+def decrypt_keystore(job: tuple) -> tuple:
+    path, password = job
+    try:
+        with open(path, 'r') as f:
+            keystore = json.load(f)
+        private_key = Account.decrypt(keystore, password).hex()
+        if not private_key.startswith('0x'):
+            private_key = '0x' + private_key
+        return path, private_key, None
+    except Exception as e:
+        return path, None, str(e)[:50]
+
+def read_keystore_accounts(directory: str, password: str) -> list:
+    try:
+        paths = sorted(
+            os.path.join(directory, name) for name in os.listdir(directory)
+            if os.path.isfile(os.path.join(directory, name)) and not name.startswith('.')
+        )
+    except FileNotFoundError:
+        print(f"{Colors.ERROR}[!] Keystore directory {directory} not found!{Colors.RESET}")
+        return []
+    except OSError as e:
+        print(f"{Colors.ERROR}[!] Error reading keystore directory: {e}{Colors.RESET}")
+        return []
+    if not paths:
+        return []
+    start = time.time()
+    # Check the password on the first valid keystore before paying for the whole fleet
+    total = len(paths)
+    accounts = []
+    while paths and not accounts:
+        path, private_key, error = decrypt_keystore((paths.pop(0), password))
+        if private_key:
+            accounts.append(private_key)
+        elif "MAC mismatch" in error:
+            print(f"{Colors.ERROR}[!] Wrong keystore password ({os.path.basename(path)}: MAC mismatch), aborting{Colors.RESET}")
+            return []
+        else:
+            print(f"{Colors.ERROR}[!] Failed to decrypt {os.path.basename(path)}: {error}{Colors.RESET}")
+    if not accounts:
+        return []
+    if paths:
+        workers = min(os.cpu_count() or 1, len(paths))
+        chunksize = max(1, len(paths) // (workers * 4))
+        print(f"{Colors.INFO}ℹ Decrypting {len(paths)} more keystore(s) on {workers} process(es)...{Colors.RESET}")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            jobs = ((path, password) for path in paths)
+            for path, private_key, error in executor.map(decrypt_keystore, jobs, chunksize=chunksize):
+                if private_key:
+                    accounts.append(private_key)
+                else:
+                    print(f"{Colors.ERROR}[!] Failed to decrypt {os.path.basename(path)}: {error}{Colors.RESET}")
+    elapsed = time.time() - start
+    print(f"{Colors.SUCCESS}✓ Decrypted {len(accounts)}/{total} keystore(s) in {elapsed:.1f}s{Colors.RESET}")
+    return accounts
+
+def load_accounts(keystore_dir: Optional[str] = None) -> list:
+    if not keystore_dir:
+        return read_accounts("accounts.txt")
+    password = os.environ.get("KEYSTORE_PASSWORD")
+    if password is None:
+        password = getpass.getpass("Keystore password: ")
+    return read_keystore_accounts(keystore_dir, password)
+
 def print_banner():
     banner = f"""
 {Colors.HEADER}{Colors.BOLD}
@@ -389,11 +479,421 @@ def countdown_timer(seconds: int, message: str):
         time.sleep(1)
     print(f"\r{Colors.SUCCESS}{message} Complete!{Colors.RESET}" + " " * 20)
 
-def main():
+def normalize_private_key(private_key: str) -> tuple:
+    private_key = private_key.strip()
+    if not private_key.startswith('0x'):
+        private_key = '0x' + private_key
+    return private_key, Account.from_key(private_key).address
+
+class ControlRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+                response = self.server.bot_daemon.handle_command(request)
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            self.wfile.write((json.dumps(response) + "\n").encode())
+            self.wfile.flush()
+
+class ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, bot_daemon):
+        self.bot_daemon = bot_daemon
+        super().__init__(socket_path, ControlRequestHandler)
+
+class BotDaemon:
+    def __init__(self, bot: HumanoidAuthBot, accounts: list, socket_path: str, items_per_cycle: int = 3, wait_hours: int = 24):
+        self.bot = bot
+        self.socket_path = socket_path
+        self.items_per_cycle = items_per_cycle
+        self.wait_seconds = wait_hours * 3600
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.server = None
+        self.accounts = {}
+        self.account_status = {}
+        self.tokens = {}
+        self.pending = []
+        self.unreached = set()
+        self.paused = False
+        self.state = "starting"
+        self.current_account = None
+        self.cycle_num = 0
+        self.next_cycle_at = None
+        self.total_successful = 0
+        self.total_failed = 0
+        self.all_models = []
+        self.all_datasets = []
+        self.cycle_models = []
+        self.cycle_datasets = []
+        for private_key in accounts:
+            try:
+                private_key, address = normalize_private_key(private_key)
+            except Exception as e:
+                print(f"{Colors.ERROR}[!] Skipping invalid private key: {str(e)[:50]}{Colors.RESET}")
+                continue
+            self.accounts[address] = private_key
+            self.account_status[address] = self._new_status()
+
+    def _new_status(self) -> dict:
+        return {"runs": 0, "successful": 0, "failed": 0, "last_result": None, "last_run": None}
+
+    # ---- control API (called from the control server threads) ----
+
+    def handle_command(self, request: dict) -> dict:
+        commands = {
+            "status": self.cmd_status,
+            "add-account": self.cmd_add_account,
+            "remove-account": self.cmd_remove_account,
+            "pause": self.cmd_pause,
+            "resume": self.cmd_resume,
+            "reload-catalogs": self.cmd_reload_catalogs,
+        }
+        command = request.get("command")
+        handler = commands.get(command)
+        if not handler:
+            return {"ok": False, "error": f"Unknown command: {command}"}
+        return handler(request)
+
+    def cmd_status(self, request: dict) -> dict:
+        with self.lock:
+            next_cycle_in = None
+            if self.next_cycle_at is not None:
+                next_cycle_in = max(0, int(self.next_cycle_at - time.time()))
+            return {
+                "ok": True,
+                "state": "paused" if self.paused else self.state,
+                "paused": self.paused,
+                "cycle": self.cycle_num,
+                "next_cycle_in": next_cycle_in,
+                "current_account": self.current_account,
+                "pending": list(self.pending),
+                "models": len(self.all_models),
+                "datasets": len(self.all_datasets),
+                "total_successful": self.total_successful,
+                "total_failed": self.total_failed,
+                "accounts": [
+                    dict(self.account_status[address], address=address, logged_in=address in self.tokens)
+                    for address in self.accounts
+                ],
+            }
+
+    def cmd_add_account(self, request: dict) -> dict:
+        try:
+            private_key, address = normalize_private_key(request.get("private_key") or "")
+        except Exception:
+            return {"ok": False, "error": "Invalid private key"}
+        with self.lock:
+            if address in self.accounts:
+                return {"ok": False, "error": f"Account {address} already loaded"}
+            self.accounts[address] = private_key
+            self.account_status[address] = self._new_status()
+            self.pending.append(address)
+        self.wake.set()
+        return {"ok": True, "address": address}
+
+    def cmd_remove_account(self, request: dict) -> dict:
+        address = (request.get("address") or "").strip()
+        with self.lock:
+            match = next((a for a in self.accounts if a.lower() == address.lower()), None)
+            if not match:
+                return {"ok": False, "error": f"Account {address} not found"}
+            del self.accounts[match]
+            del self.account_status[match]
+            if match in self.pending:
+                self.pending.remove(match)
+            self.tokens.pop(match, None)
+        return {"ok": True, "address": match}
+
+    def cmd_pause(self, request: dict) -> dict:
+        with self.lock:
+            self.paused = True
+        return {"ok": True, "paused": True}
+
+    def cmd_resume(self, request: dict) -> dict:
+        with self.lock:
+            self.paused = False
+        self.wake.set()
+        return {"ok": True, "paused": False}
+
+    def cmd_reload_catalogs(self, request: dict) -> dict:
+        models = self.bot.get_training_models(use_defaults=False)
+        datasets = self.bot.get_training_datasets(use_defaults=False)
+        if not models:
+            return {"ok": False, "error": "models.txt is missing or empty, keeping current catalogs"}
+        if not datasets:
+            return {"ok": False, "error": "datasets.txt is missing or empty, keeping current catalogs"}
+        with self.lock:
+            self.all_models = models
+            self.all_datasets = datasets
+        return {"ok": True, "models": len(models), "datasets": len(datasets)}
+
+    # ---- main loop ----
+
+    def start_control_server(self) -> bool:
+        if os.path.lexists(self.socket_path):
+            if not stat.S_ISSOCK(os.lstat(self.socket_path).st_mode):
+                print(f"{Colors.ERROR}[!] {self.socket_path} exists and is not a socket, refusing to replace it{Colors.RESET}")
+                return False
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(self.socket_path)
+                    print(f"{Colors.ERROR}[!] Another daemon is already listening on {self.socket_path}{Colors.RESET}")
+                    return False
+                except OSError:
+                    pass
+            os.remove(self.socket_path)
+        old_umask = os.umask(0o177)
+        try:
+            self.server = ControlServer(self.socket_path, self)
+        finally:
+            os.umask(old_umask)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        print(f"{Colors.SUCCESS}✓ Control socket listening on {self.socket_path}{Colors.RESET}")
+        return True
+
+    def stop_control_server(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+            if os.path.lexists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def wait_while_paused(self):
+        announced = False
+        while True:
+            with self.lock:
+                if not self.paused:
+                    return
+            if not announced:
+                print(f"\n{Colors.WARNING}[!] Paused, waiting for resume...{Colors.RESET}")
+                announced = True
+            self.wake.wait(1)
+            self.wake.clear()
+
+    def wait_for_accounts(self):
+        announced = False
+        while True:
+            with self.lock:
+                if self.accounts:
+                    return
+                self.state = "idle"
+            if not announced:
+                print(f"\n{Colors.WARNING}[!] No accounts loaded, waiting for add-account...{Colors.RESET}")
+                announced = True
+            self.wake.wait(1)
+            self.wake.clear()
+
+    def process(self, address: str, index: int, total: int) -> Optional[bool]:
+        self.wait_while_paused()
+        with self.lock:
+            private_key = self.accounts.get(address)
+            if private_key is None:
+                return None
+            self.current_account = address
+            self.state = "running"
+            models, datasets = self.cycle_models, self.cycle_datasets
+        result = self.bot.process_account(private_key, index, total, models, datasets, self.tokens)
+        with self.lock:
+            self.current_account = None
+            if address not in self.accounts:
+                self.tokens.pop(address, None)
+            status = self.account_status.get(address)
+            if status is not None:
+                status["runs"] += 1
+                status["successful" if result else "failed"] += 1
+                status["last_result"] = "success" if result else "failed"
+                status["last_run"] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            if result:
+                self.total_successful += 1
+            else:
+                self.total_failed += 1
+        return result
+
+    def process_pending(self) -> tuple:
+        successful = 0
+        failed = 0
+        while True:
+            with self.lock:
+                if self.paused or not self.pending:
+                    break
+                address = self.pending.pop(0)
+                if address in self.unreached:
+                    # Still ahead in the current pass, the main loop will process it
+                    continue
+                total = len(self.accounts)
+                index = list(self.accounts).index(address) + 1 if address in self.accounts else total
+            result = self.process(address, index, total)
+            if result is True:
+                successful += 1
+            elif result is False:
+                failed += 1
+        return successful, failed
+
+    def run_cycle(self):
+        with self.lock:
+            self.cycle_num += 1
+            self.next_cycle_at = None
+            self.state = "running"
+            self.cycle_models = self.bot.get_items_for_cycle(self.all_models, self.items_per_cycle, 'progress_models.txt')
+            self.cycle_datasets = self.bot.get_items_for_cycle(self.all_datasets, self.items_per_cycle, 'progress_datasets.txt')
+            addresses = list(self.accounts)
+            self.unreached = set(addresses)
+            self.pending = []
+            cycle_num = self.cycle_num
+        print(f"\n{Colors.HEADER}{Colors.BOLD}{'═' * 60}{Colors.RESET}")
+        print(f"{Colors.HEADER}{Colors.BOLD}STARTING CYCLE {cycle_num}{Colors.RESET}")
+        print(f"{Colors.INFO}Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Colors.RESET}")
+        print(f"{Colors.WARNING}\nModels for this cycle:{Colors.RESET}")
+        for i, model in enumerate(self.cycle_models, 1):
+            print(f"{Colors.WARNING}  {i}. {model['fileName']}{Colors.RESET}")
+        print(f"{Colors.DATASET}\nDatasets for this cycle:{Colors.RESET}")
+        for i, dataset in enumerate(self.cycle_datasets, 1):
+            print(f"{Colors.DATASET}  {i}. {dataset['fileName']}{Colors.RESET}")
+        print(f"{Colors.HEADER}{Colors.BOLD}{'═' * 60}{Colors.RESET}")
+        successful = 0
+        failed = 0
+        for i, address in enumerate(addresses, 1):
+            with self.lock:
+                self.unreached.discard(address)
+            result = self.process(address, i, len(addresses))
+            if result is not None:
+                if result:
+                    successful += 1
+                else:
+                    failed += 1
+            # Accounts added mid-cycle run at the next account boundary
+            pending_successful, pending_failed = self.process_pending()
+            successful += pending_successful
+            failed += pending_failed
+            if result is not None and i < len(addresses):
+                time.sleep(3)
+        pending_successful, pending_failed = self.process_pending()
+        successful += pending_successful
+        failed += pending_failed
+        if successful + failed:
+            print_summary(successful, failed, successful + failed, cycle_num)
+        print(f"{Colors.HEADER}{'─' * 60}{Colors.RESET}")
+        print(f"{Colors.BOLD}TOTAL STATS (All Cycles){Colors.RESET}")
+        print(f"{Colors.SUCCESS}Total Successful: {self.total_successful}{Colors.RESET}")
+        print(f"{Colors.ERROR}Total Failed    : {self.total_failed}{Colors.RESET}")
+        print(f"{Colors.HEADER}{'─' * 60}{Colors.RESET}\n")
+
+    def wait_for_next_cycle(self, message: str):
+        with self.lock:
+            self.next_cycle_at = time.time() + self.wait_seconds
+            self.state = "waiting"
+        print(f"{Colors.WARNING}Waiting {self.wait_seconds // 3600} hours before next cycle...{Colors.RESET}")
+        while True:
+            with self.lock:
+                has_pending = bool(self.pending) and not self.paused
+            if has_pending:
+                print()
+                self.process_pending()
+                with self.lock:
+                    self.state = "waiting"
+            remaining = self.next_cycle_at - time.time()
+            if remaining <= 0:
+                break
+            hours = int(remaining // 3600)
+            minutes = int((remaining % 3600) // 60)
+            secs = int(remaining % 60)
+            timer_str = f"{hours:02d}:{minutes:02d}:{secs:02d}"
+            print(f"\r{Colors.WARNING}{message} {timer_str}{Colors.RESET}", end="", flush=True)
+            self.wake.wait(min(1, remaining))
+            self.wake.clear()
+        print(f"\r{Colors.SUCCESS}{message} Complete!{Colors.RESET}" + " " * 20)
+
+    def run(self):
+        self.all_models = self.bot.get_training_models()
+        self.all_datasets = self.bot.get_training_datasets()
+        if not self.all_models:
+            print(f"{Colors.ERROR}[!] No models found{Colors.RESET}")
+            return
+        if not self.all_datasets:
+            print(f"{Colors.ERROR}[!] No datasets found{Colors.RESET}")
+            return
+        print(f"{Colors.SUCCESS}✓ Loaded {len(self.all_models)} total models{Colors.RESET}")
+        print(f"{Colors.SUCCESS}✓ Loaded {len(self.all_datasets)} total datasets{Colors.RESET}")
+        if not self.start_control_server():
+            return
+        try:
+            while True:
+                # Empty cycles would still advance the model/dataset rotation
+                self.wait_for_accounts()
+                self.wait_while_paused()
+                self.run_cycle()
+                self.wait_for_next_cycle("Next cycle in:")
+        finally:
+            self.stop_control_server()
+
+def send_control_command(socket_path: str, request: dict) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(10)
+        client.connect(socket_path)
+        client.sendall((json.dumps(request) + "\n").encode())
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    return json.loads(data)
+
+def run_daemon(socket_path: str, keystore_dir: Optional[str] = None):
     print_banner()
-    accounts = read_accounts("accounts.txt")
+    if not hasattr(socket, "AF_UNIX"):
+        print(f"{Colors.ERROR}[!] Daemon mode requires Unix domain socket support{Colors.RESET}")
+        return
+    accounts = load_accounts(keystore_dir)
+    if keystore_dir and not accounts:
+        print(f"{Colors.ERROR}[!] No accounts loaded from {keystore_dir}, not starting the daemon{Colors.RESET}")
+        return
+    print(f"{Colors.SUCCESS}✓ Loaded {len(accounts)} account(s){Colors.RESET}")
+    bot_daemon = BotDaemon(HumanoidAuthBot(), accounts, socket_path)
+    bot_daemon.run()
+
+def run_control(socket_path: str, command: str, value: Optional[str]) -> bool:
+    request = {"command": command}
+    if command == "add-account":
+        if value:
+            print(f"{Colors.ERROR}[!] Do not pass private keys as arguments, add-account reads the key from a prompt or stdin{Colors.RESET}")
+            return False
+        if sys.stdin.isatty():
+            request["private_key"] = getpass.getpass("Private key: ")
+        else:
+            request["private_key"] = sys.stdin.readline().strip()
+    elif command == "remove-account":
+        if not value or len(value) != 42 or not value.startswith('0x'):
+            print(f"{Colors.ERROR}[!] remove-account requires a wallet address{Colors.RESET}")
+            return False
+        request["address"] = value
+    try:
+        response = send_control_command(socket_path, request)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"{Colors.ERROR}[!] No daemon listening on {socket_path}{Colors.RESET}")
+        return False
+    except OSError as e:
+        print(f"{Colors.ERROR}[!] Control socket error: {e}{Colors.RESET}")
+        return False
+    except ValueError:
+        print(f"{Colors.ERROR}[!] Invalid response from daemon{Colors.RESET}")
+        return False
+    color = Colors.SUCCESS if response.get("ok") else Colors.ERROR
+    print(f"{color}{json.dumps(response, indent=2)}{Colors.RESET}")
+    return bool(response.get("ok"))
+
+def main(keystore_dir: Optional[str] = None):
+    print_banner()
+    accounts = load_accounts(keystore_dir)
     if not accounts:
-        print(f"{Colors.ERROR}[!] No accounts found in accounts.txt{Colors.RESET}")
+        print(f"{Colors.ERROR}[!] No accounts found in {keystore_dir or 'accounts.txt'}{Colors.RESET}")
         return
     print(f"{Colors.SUCCESS}✓ Loaded {len(accounts)} account(s){Colors.RESET}")
     bot = HumanoidAuthBot()
@@ -447,9 +947,28 @@ def main():
         print(f"{Colors.WARNING}Waiting {wait_hours} hours before next cycle...{Colors.RESET}")
         countdown_timer(wait_seconds, "Next cycle in:")
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Humanoid Network Auto Bot")
+    parser.add_argument("--daemon", action="store_true", help="run as a long-lived daemon with a control socket")
+    parser.add_argument("--socket", default="humanoid.sock", help="control socket path (default: humanoid.sock)")
+    parser.add_argument("--keystore", metavar="DIR",
+                        help="load encrypted keystore JSON files from DIR instead of accounts.txt "
+                             "(password from KEYSTORE_PASSWORD or prompt)")
+    parser.add_argument("--ctl", nargs="+", metavar=("COMMAND", "VALUE"),
+                        help="send a command to a running daemon: status, add-account (key via prompt/stdin), "
+                             "remove-account ADDRESS, pause, resume, reload-catalogs")
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.ctl:
+        ok = run_control(args.socket, args.ctl[0], args.ctl[1] if len(args.ctl) > 1 else None)
+        sys.exit(0 if ok else 1)
     try:
-        main()
+        if args.daemon:
+            run_daemon(args.socket, args.keystore)
+        else:
+            main(args.keystore)
     except KeyboardInterrupt:
         print(f"\n\n{Colors.WARNING}[!] Bot stopped by user{Colors.RESET}")
     except Exception as e: